@@ -6,6 +6,7 @@ from functools import partial
 from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
 from tqdm import tqdm
 from matchms import Spectrum
 from matchms.exporting import save_spectra
@@ -36,14 +37,19 @@ class SpectrumProcessor:
                                          FunctionWithParametersType]]):
         self.filters = []
         self.filter_order = [x.__name__ for x in ALL_FILTERS]
+        self._fused_chain = None
+        # Bulk build: sorting once afterwards avoids re-sorting the filter
+        # list for every single filter added.
         for filter_name in filters:
-            self.parse_and_add_filter(filter_name)
+            self.parse_and_add_filter(filter_name, sort_filters=False)
+        self._sort_filters()
 
     def parse_and_add_filter(self, filter_description: Union[str,
                                                              Callable,
                                                              FunctionWithParametersType,
                                                              ],
-                             filter_position: Optional[int] = None):
+                             filter_position: Optional[int] = None,
+                             sort_filters: bool = True):
         """Adds a filter, by parsing the different allowed inputs.
 
         filter:
@@ -56,6 +62,9 @@ class SpectrumProcessor:
             If None: Matchms filters are automatically ordered.
             Custom filters will be added at the end of the filter list.
             If not None, the filter will be added to the given position in the filter order list.
+        sort_filters:
+            If True (default) the filter list is re-sorted after adding. Set to False
+            when adding filters in bulk and call _sort_filters once afterwards.
         """
         filter_args = None
         if isinstance(filter_description, (tuple, list)):
@@ -73,19 +82,29 @@ class SpectrumProcessor:
             filter_function = load_matchms_filter_from_string(filter_function)
         self._add_filter_to_filter_order(filter_function.__name__,
                                          filter_position=filter_position)
-        self._store_filter(filter_function, filter_args)
+        self._store_filter(filter_function, filter_args, sort_filters=sort_filters)
 
     def _store_filter(self,
                       new_filter_function: Callable,
-                      filter_params: Optional[Dict[str, any]]):
+                      filter_params: Optional[Dict[str, any]],
+                      sort_filters: bool = True):
         """Stores filter, removes duplicates and sorts filters"""
         if not callable(new_filter_function):
             raise TypeError("Expected callable filter function.")
         new_filter_function = create_partial_function(new_filter_function, filter_params)
         check_all_parameters_given(new_filter_function)
         self._replace_already_stored_filters(new_filter_function)
-        # Sort filters according to their order in self.filter_order
-        self.filters.sort(key=lambda f: self.filter_order.index(f.__name__))
+        if sort_filters:
+            self._sort_filters()
+        # The fused filter chain no longer matches the filter list
+        self._fused_chain = None
+
+    def _sort_filters(self):
+        """Sorts the filters according to their order in self.filter_order.
+
+        A dict gives O(1) lookups, list.index would rescan filter_order per filter."""
+        order_index = {filter_name: i for i, filter_name in enumerate(self.filter_order)}
+        self.filters.sort(key=lambda f: order_index[f.__name__])
 
     def _replace_already_stored_filters(self,
                                        new_filter_function: Callable):
@@ -149,12 +168,14 @@ class SpectrumProcessor:
         Spectrum
             The processed spectrum.
         """
-        if processing_report is not None:
-            processing_report.counter_number_processed += 1
+        if processing_report is None:
+            if self._fused_chain is None:
+                self._fused_chain = _compile_filter_chain(self.filters)
+            return self._fused_chain(spectrum)
+        processing_report.counter_number_processed += 1
         for filter_func in self.filters:
             spectrum_out = filter_func(spectrum)
-            if processing_report is not None:
-                processing_report.add_to_report(spectrum, spectrum_out, filter_func.__name__)
+            processing_report.add_to_report(spectrum, spectrum_out, filter_func.__name__)
             if spectrum_out is None:
                 return None
             spectrum = spectrum_out
@@ -162,7 +183,9 @@ class SpectrumProcessor:
 
     def process_spectrums(self, spectrums: list,
                           progress_bar: bool = True,
-                          cleaned_spectra_file=None
+                          cleaned_spectra_file=None,
+                          n_jobs: Optional[int] = None,
+                          chunk_size: Optional[int] = None,
                           ):
         """
         Process a list of spectrums with all filters in the processing pipeline.
@@ -178,6 +201,15 @@ class SpectrumProcessor:
             Displays progress bar if set to True. Default is True.
         cleaned_spectra_file:
             Path to where the cleaned spectra should be saved.
+        n_jobs:
+            Number of parallel worker processes, following joblib conventions
+            (-1 uses all available cores). Default is None which means
+            sequential processing. Spectra are processed independently, so the
+            workload scales nearly linearly with the number of cores.
+        chunk_size:
+            Number of spectra sent to a worker at once. Only used when n_jobs
+            enables parallel processing. The default aims at a few chunks per
+            worker to balance scheduling overhead against load balancing.
 
         Returns
         -------
@@ -191,21 +223,47 @@ class SpectrumProcessor:
                 raise FileExistsError("The specified save references file already exists")
         if not self.filters:
             logger.warning("No filters have been specified, so spectra were not filtered")
-        processing_report = ProcessingReport(self.filters)
 
-        processed_spectrums = []
-        for s in tqdm(spectrums, disable=(not progress_bar), desc="Processing spectrums"):
-            if s is None:
-                continue  # empty spectra will be discarded
-            processed_spectrum = self.process_spectrum(s, processing_report)
-            if processed_spectrum is not None:
-                processed_spectrums.append(processed_spectrum)
+        if n_jobs is not None and n_jobs != 1:
+            processed_spectrums, processing_report = \
+                self._process_spectrums_parallel(spectrums, n_jobs, chunk_size, progress_bar)
+        else:
+            processing_report = ProcessingReport(self.filters)
+            processed_spectrums = []
+            for s in tqdm(spectrums, disable=(not progress_bar), desc="Processing spectrums"):
+                if s is None:
+                    continue  # empty spectra will be discarded
+                processed_spectrum = self.process_spectrum(s, processing_report)
+                if processed_spectrum is not None:
+                    processed_spectrums.append(processed_spectrum)
 
         if cleaned_spectra_file is not None:
             save_spectra(processed_spectrums, cleaned_spectra_file)
 
         return processed_spectrums, processing_report
 
+    def _process_spectrums_parallel(self, spectrums, n_jobs, chunk_size, progress_bar):
+        """Process spectrums in parallel worker processes.
+
+        The spectrums are split into chunks and each worker runs the full
+        filter pipeline on its chunk with a local ProcessingReport; the
+        reports are combined afterwards.
+        """
+        n_workers = effective_n_jobs(n_jobs)
+        if chunk_size is None:
+            chunk_size = max(1, len(spectrums) // (4 * n_workers) + 1)
+        chunks = [spectrums[i:i + chunk_size] for i in range(0, len(spectrums), chunk_size)]
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(_process_spectrums_chunk)(self, chunk)
+            for chunk in tqdm(chunks, disable=(not progress_bar), desc="Processing spectrum chunks"))
+
+        processing_report = ProcessingReport(self.filters)
+        processed_spectrums = []
+        for chunk_spectrums, chunk_report in results:
+            processed_spectrums.extend(chunk_spectrums)
+            processing_report.combine(chunk_report)
+        return processed_spectrums, processing_report
+
     @property
     def processing_steps(self):
         filter_list = []
@@ -222,6 +280,49 @@ class SpectrumProcessor:
         workflow["Processing steps"] = self.processing_steps
         return ordered_dump(workflow)
 
+    def __getstate__(self):
+        # The fused chain is a generated function and cannot be pickled,
+        # it is recompiled lazily after unpickling.
+        state = self.__dict__.copy()
+        state["_fused_chain"] = None
+        return state
+
+
+def _process_spectrums_chunk(processor: "SpectrumProcessor", spectrums: list):
+    """Run the full filter pipeline on a chunk of spectrums (worker side)."""
+    processing_report = ProcessingReport(processor.filters)
+    processed_spectrums = []
+    for s in spectrums:
+        if s is None:
+            continue  # empty spectra will be discarded
+        processed_spectrum = processor.process_spectrum(s, processing_report)
+        if processed_spectrum is not None:
+            processed_spectrums.append(processed_spectrum)
+    return processed_spectrums, processing_report
+
+
+def _compile_filter_chain(filters: List[Callable]) -> Callable:
+    """Fuse a fixed filter sequence into one generated function.
+
+    The generated function inlines the per-filter loop of process_spectrum,
+    including the early return on None. This removes the per-spectrum list
+    iteration and per-filter Python frame overhead when no processing report
+    is requested. Filters are bound as default arguments so they are loaded
+    as fast locals inside the generated function.
+    """
+    if not filters:
+        return lambda spectrum: spectrum
+    arguments = ", ".join(f"f{i}=f{i}" for i in range(len(filters)))
+    lines = [f"def _apply_filters(spectrum, {arguments}):"]
+    for i in range(len(filters)):
+        lines.append(f"    spectrum = f{i}(spectrum)")
+        lines.append("    if spectrum is None:")
+        lines.append("        return None")
+    lines.append("    return spectrum")
+    scope = {f"f{i}": filter_function for i, filter_function in enumerate(filters)}
+    exec("\n".join(lines), scope)  # pylint: disable=exec-used
+    return scope["_apply_filters"]
+
 
 def load_matchms_filter_from_string(filter_name):
     if not isinstance(filter_name, str):
@@ -297,6 +398,16 @@ class ProcessingReport:
             if spectrum_new.peaks != spectrum_old.peaks or spectrum_new.losses != spectrum_old.losses:
                 self.counter_changed_peaks[filter_function_name] += 1
 
+    def combine(self, other: "ProcessingReport"):
+        """Add the counts of another report to this report."""
+        self.counter_number_processed += other.counter_number_processed
+        for filter_name, count in other.counter_changed_metadata.items():
+            self.counter_changed_metadata[filter_name] += count
+        for filter_name, count in other.counter_removed_spectrums.items():
+            self.counter_removed_spectrums[filter_name] += count
+        for filter_name, count in other.counter_changed_peaks.items():
+            self.counter_changed_peaks[filter_name] += count
+
     def to_dataframe(self):
         """Create Pandas DataFrame Report of counted spectrum changes."""
         metadata_changed = pd.DataFrame(self.counter_changed_metadata.items(),
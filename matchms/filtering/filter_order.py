@@ -5,7 +5,7 @@ from matchms import filtering as msfilters
 
 # IMPORTANT!! IF YOU CHANGE ANYTHING HERE PLEASE ADD A TEST to test_all_filter_order.py
 # to ensure it is not changed back by accident later.
-ALL_FILTERS = [msfilters.make_charge_int,
+ALL_FILTERS = (msfilters.make_charge_int,
                msfilters.add_compound_name,
                msfilters.derive_adduct_from_name,
                msfilters.derive_formula_from_name,
@@ -48,6 +48,6 @@ ALL_FILTERS = [msfilters.make_charge_int,
                msfilters.require_minimum_number_of_high_peaks,
                msfilters.add_fingerprint,
                msfilters.add_losses,
-               ]
+               )
 
 FILTER_FUNCTION_NAMES = {x.__name__: x for x in ALL_FILTERS}
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Optional
 
 
@@ -26,8 +27,13 @@ def convert_smiles_to_inchi(smiles: str) -> Optional[str]:
     return mol_converter(smiles, "smiles", "inchi")
 
 
+@lru_cache(maxsize=100_000)
 def convert_inchi_to_smiles(inchi: str) -> Optional[str]:
-    """Convert inchi to smiles using rdkit."""
+    """Convert inchi to smiles using rdkit.
+
+    The conversion is pure and the same InChI typically reappears across
+    many library spectra, so results are cached (use
+    ``convert_inchi_to_smiles.cache_clear()`` to reset)."""
     return mol_converter(inchi, "inchi", "smiles")
 
 
@@ -74,11 +80,13 @@ def mol_converter(mol_input: str, input_type: str, output_type: str) -> Optional
     return None
 
 
+@lru_cache(maxsize=100_000)
 def is_valid_inchi(inchi: str) -> bool:
     """Return True if input string is valid InChI.
 
     This functions test if string can be read by rdkit as InChI.
     Requires conda package *rdkit* to be installed.
+    Results are cached since the rdkit round-trip dominates the cost.
 
     Parameters
     ----------
@@ -102,11 +110,13 @@ def is_valid_inchi(inchi: str) -> bool:
     return False
 
 
+@lru_cache(maxsize=100_000)
 def is_valid_smiles(smiles: str) -> bool:
     """Return True if input string is valid smiles.
 
     This functions test if string can be read by rdkit as smiles.
     Requires conda package *rdkit* to be installed.
+    Results are cached since the rdkit round-trip dominates the cost.
 
     Parameters
     ----------
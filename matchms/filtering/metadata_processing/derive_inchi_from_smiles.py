@@ -12,17 +12,20 @@ def derive_inchi_from_smiles(spectrum_in: SpectrumType) -> SpectrumType:
     if spectrum_in is None:
         return None
 
-    spectrum = spectrum_in.clone()
-    inchi = spectrum.get("inchi")
-    smiles = spectrum.get("smiles")
-
-    if not is_valid_inchi(inchi) and is_valid_smiles(smiles):
-        inchi = convert_smiles_to_inchi(smiles)
-        if inchi:
-            inchi = inchi.rstrip()
-            spectrum.set("inchi", inchi)
-            logger.info("Added InChI (%s) to metadata (was converted from smiles).", inchi)
-        else:
-            logger.warning("Could not convert smiles %s to InChI.", smiles)
+    inchi = spectrum_in.get("inchi")
+    smiles = spectrum_in.get("smiles")
+
+    # Only clone the spectrum when an inchi will actually be added
+    if is_valid_inchi(inchi) or not is_valid_smiles(smiles):
+        return spectrum_in
 
+    inchi = convert_smiles_to_inchi(smiles)
+    if not inchi:
+        logger.warning("Could not convert smiles %s to InChI.", smiles)
+        return spectrum_in
+
+    spectrum = spectrum_in.clone()
+    inchi = inchi.rstrip()
+    spectrum.set("inchi", inchi)
+    logger.info("Added InChI (%s) to metadata (was converted from smiles).", inchi)
     return spectrum
@@ -12,16 +12,19 @@ def derive_inchikey_from_inchi(spectrum_in: SpectrumType) -> SpectrumType:
     if spectrum_in is None:
         return None
 
-    spectrum = spectrum_in.clone()
-    inchi = spectrum.get("inchi")
-    inchikey = spectrum.get("inchikey")
+    inchi = spectrum_in.get("inchi")
+    inchikey = spectrum_in.get("inchikey")
+
+    # Only clone the spectrum when an inchikey will actually be added
+    if is_valid_inchikey(inchikey) or not is_valid_inchi(inchi):
+        return spectrum_in
 
-    if is_valid_inchi(inchi) and not is_valid_inchikey(inchikey):
-        inchikey = convert_inchi_to_inchikey(inchi)
-        if inchikey:
-            spectrum.set("inchikey", inchikey)
-            logger.info("Added InChIKey %s to metadata (was converted from inchi)", inchikey)
-        else:
-            logger.warning("Could not convert InChI %s to inchikey.", inchi)
+    inchikey = convert_inchi_to_inchikey(inchi)
+    if not inchikey:
+        logger.warning("Could not convert InChI %s to inchikey.", inchi)
+        return spectrum_in
 
+    spectrum = spectrum_in.clone()
+    spectrum.set("inchikey", inchikey)
+    logger.info("Added InChIKey %s to metadata (was converted from inchi)", inchikey)
     return spectrum
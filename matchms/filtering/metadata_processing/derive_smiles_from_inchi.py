@@ -12,17 +12,20 @@ def derive_smiles_from_inchi(spectrum_in: SpectrumType) -> SpectrumType:
     if spectrum_in is None:
         return None
 
-    spectrum = spectrum_in.clone()
-    inchi = spectrum.get("inchi")
-    smiles = spectrum.get("smiles")
-
-    if not is_valid_smiles(smiles) and is_valid_inchi(inchi):
-        smiles = convert_inchi_to_smiles(inchi)
-        if smiles:
-            smiles = smiles.rstrip()
-            spectrum.set("smiles", smiles)
-            logger.info("Added smiles %s to metadata (was converted from InChI)", smiles)
-        else:
-            logger.warning("Could not convert InChI %s to smiles.", inchi)
+    inchi = spectrum_in.get("inchi")
+    smiles = spectrum_in.get("smiles")
+
+    # Only clone the spectrum when a smiles will actually be added
+    if is_valid_smiles(smiles) or not is_valid_inchi(inchi):
+        return spectrum_in
 
+    smiles = convert_inchi_to_smiles(inchi)
+    if not smiles:
+        logger.warning("Could not convert InChI %s to smiles.", inchi)
+        return spectrum_in
+
+    spectrum = spectrum_in.clone()
+    smiles = smiles.rstrip()
+    spectrum.set("smiles", smiles)
+    logger.info("Added smiles %s to metadata (was converted from InChI)", smiles)
     return spectrum
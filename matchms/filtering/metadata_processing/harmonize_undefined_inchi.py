@@ -17,8 +17,6 @@ def harmonize_undefined_inchi(spectrum_in: SpectrumType, undefined: str = "",
     if spectrum_in is None:
         return None
 
-    spectrum = spectrum_in.clone()
-
     if aliases is None:
         aliases = [
             "",
@@ -27,14 +25,13 @@ def harmonize_undefined_inchi(spectrum_in: SpectrumType, undefined: str = "",
             "n/a"
         ]
 
-    inchi = spectrum.get("inchi")
-    if inchi is None:
-        # spectrum does not have an "inchi" key in its metadata
-        spectrum.set("inchi", undefined)
-        return spectrum
-
-    if inchi in aliases:
-        # harmonize aliases for undefined values
-        spectrum.set("inchi", undefined)
+    inchi = spectrum_in.get("inchi")
+    if inchi is not None and inchi not in aliases:
+        return spectrum_in
+    if inchi == undefined:
+        return spectrum_in
 
+    # Inchi is missing or an alias for undefined, harmonize the entry
+    spectrum = spectrum_in.clone()
+    spectrum.set("inchi", undefined)
     return spectrum
@@ -17,8 +17,6 @@ def harmonize_undefined_inchikey(spectrum_in: SpectrumType, undefined: str = "",
     if spectrum_in is None:
         return None
 
-    spectrum = spectrum_in.clone()
-
     if aliases is None:
         aliases = [
             "",
@@ -28,14 +26,13 @@ def harmonize_undefined_inchikey(spectrum_in: SpectrumType, undefined: str = "",
             "no data"
         ]
 
-    inchikey = spectrum.get("inchikey")
-    if inchikey is None:
-        # spectrum does not have an "inchikey" key in its metadata
-        spectrum.set("inchikey", undefined)
-        return spectrum
-
-    if inchikey in aliases:
-        # harmonize aliases for undefined values
-        spectrum.set("inchikey", undefined)
+    inchikey = spectrum_in.get("inchikey")
+    if inchikey is not None and inchikey not in aliases:
+        return spectrum_in
+    if inchikey == undefined:
+        return spectrum_in
 
+    # Inchikey is missing or an alias for undefined, harmonize the entry
+    spectrum = spectrum_in.clone()
+    spectrum.set("inchikey", undefined)
     return spectrum
@@ -17,8 +17,6 @@ def harmonize_undefined_smiles(spectrum_in: SpectrumType, undefined: str = "",
     if spectrum_in is None:
         return None
 
-    spectrum = spectrum_in.clone()
-
     if aliases is None:
         aliases = [
             "",
@@ -28,14 +26,13 @@ def harmonize_undefined_smiles(spectrum_in: SpectrumType, undefined: str = "",
             "no data"
         ]
 
-    smiles = spectrum.get("smiles")
-    if smiles is None:
-        # spectrum does not have a "smiles" key in its metadata
-        spectrum.set("smiles", undefined)
-        return spectrum
-
-    if smiles in aliases:
-        # harmonize aliases for undefined values
-        spectrum.set("smiles", undefined)
+    smiles = spectrum_in.get("smiles")
+    if smiles is not None and smiles not in aliases:
+        return spectrum_in
+    if smiles == undefined:
+        return spectrum_in
 
+    # Smiles is missing or an alias for undefined, harmonize the entry
+    spectrum = spectrum_in.clone()
+    spectrum.set("smiles", undefined)
     return spectrum
@@ -85,19 +85,22 @@ class CosineGreedy(BaseSimilarity):
         """
         def get_matching_pairs():
             """Get pairs of peaks that match within the given tolerance."""
-            matching_pairs = collect_peak_pairs(spec1, spec2, self.tolerance,
+            matching_pairs = collect_peak_pairs(mz1, intensities1, mz2, intensities2,
+                                                self.tolerance,
                                                 shift=0.0, mz_power=self.mz_power,
                                                 intensity_power=self.intensity_power)
             if matching_pairs is None:
                 return None
-            matching_pairs = matching_pairs[np.argsort(matching_pairs[:, 2])[::-1], :]
+            matching_pairs = matching_pairs[np.argsort(-matching_pairs[:, 2], kind="stable"), :]
             return matching_pairs
 
-        spec1 = reference.peaks.to_numpy
-        spec2 = query.peaks.to_numpy
+        peaks1 = reference.peaks
+        peaks2 = query.peaks
+        mz1, intensities1 = peaks1.mz, peaks1.intensities
+        mz2, intensities2 = peaks2.mz, peaks2.intensities
         matching_pairs = get_matching_pairs()
         if matching_pairs is None:
             return np.asarray((float(0), 0), dtype=self.score_datatype)
-        score = score_best_matches(matching_pairs, spec1, spec2,
+        score = score_best_matches(matching_pairs, mz1, intensities1, mz2, intensities2,
                                    self.mz_power, self.intensity_power)
         return np.asarray(score, dtype=self.score_datatype)
@@ -1,7 +1,11 @@
+import weakref
 from typing import Tuple
 import numpy as np
 from scipy.optimize import linear_sum_assignment
-from matchms.similarity.spectrum_similarity_functions import collect_peak_pairs
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import min_weight_full_bipartite_matching
+from matchms.similarity.spectrum_similarity_functions import \
+    collect_peak_pairs_numpy
 from matchms.typing import SpectrumType
 from .BaseSimilarity import BaseSimilarity
 
@@ -39,6 +43,30 @@ class CosineHungarian(BaseSimilarity):
         self.tolerance = tolerance
         self.mz_power = mz_power
         self.intensity_power = intensity_power
+        self._norm_cache = {}
+
+    def _get_power_norm(self, spectrum: SpectrumType, mz: np.ndarray,
+                        intensities: np.ndarray) -> float:
+        """Return the norm of the powered peak vector, cached per spectrum.
+
+        In all-vs-all score computations every spectrum is revisited many
+        times while its norm only depends on the spectrum and the fixed
+        powers of this instance. Cache entries are keyed by object id and
+        guarded by a weak reference, so a recycled id cannot return a stale
+        norm and entries are evicted once a spectrum is garbage collected.
+        """
+        key = id(spectrum)
+        entry = self._norm_cache.get(key)
+        if entry is not None and entry[0]() is spectrum:
+            return entry[1]
+        spec_power = np.power(mz, self.mz_power) * np.power(intensities, self.intensity_power)
+        norm = np.sqrt(np.sum(spec_power**2))
+
+        def _evict(_, cache=self._norm_cache, key=key):
+            cache.pop(key, None)
+
+        self._norm_cache[key] = (weakref.ref(spectrum, _evict), norm)
+        return norm
 
     def pair(self, reference: SpectrumType, query: SpectrumType) -> Tuple[float, int]:
         """Calculate cosine score between two spectra.
@@ -57,58 +85,80 @@ class CosineHungarian(BaseSimilarity):
         """
         def get_matching_pairs():
             """Get pairs of peaks that match within the given tolerance."""
-            matching_pairs = collect_peak_pairs(spec1, spec2, self.tolerance, shift=0.0,
-                                                mz_power=self.mz_power,
-                                                intensity_power=self.intensity_power)
+            matching_pairs = collect_peak_pairs_numpy(mz1, intensities1, mz2, intensities2,
+                                                      self.tolerance, shift=0.0,
+                                                      mz_power=self.mz_power,
+                                                      intensity_power=self.intensity_power)
             if matching_pairs is None:
                 return None
-            matching_pairs = matching_pairs[np.argsort(matching_pairs[:, 2])[::-1], :]
+            matching_pairs = matching_pairs[np.argsort(-matching_pairs[:, 2], kind="stable"), :]
             return matching_pairs
 
-        def get_matching_pairs_matrix():
-            """Create matrix of multiplied intensities of all matching pairs
-            between spectrum1 and spectrum2.
-            Returns
-            paired_peaks1:
-                list of paired peaks of spectrum1
-            paired_peaks2:
-                list of paired peaks of spectrum2
-            matching_pairs_matrix:
-                Array of multiplied intensities between all matching peaks.
-            """
-            if matching_pairs is None:
-                return None, None, None
-            paired_peaks1 = list(set(matching_pairs[:, 0]))
-            paired_peaks2 = list(set(matching_pairs[:, 1]))
-            matrix_size = (len(paired_peaks1), len(paired_peaks2))
-            matching_pairs_matrix = np.ones(matrix_size)
-            for i in range(matching_pairs.shape[0]):
-                matching_pairs_matrix[paired_peaks1.index(matching_pairs[i, 0]),
-                                      paired_peaks2.index(matching_pairs[i, 1])] = 1 - matching_pairs[i, 2]
-            return paired_peaks1, paired_peaks2, matching_pairs_matrix
-
         def solve_hungarian():
-            """Use hungarian algorithm to solve the linear sum assignment problem."""
+            """Use hungarian algorithm to solve the linear sum assignment problem.
+
+            The dense cost matrix is initialized to ones; only cells of actual
+            matching pairs carry real data, so unmatched assignments contribute
+            nothing to the score.
+            """
+            matching_pairs_matrix = np.ones((inverse1.max() + 1, inverse2.max() + 1))
+            matching_pairs_matrix[inverse1, inverse2] = 1 - products
             row_ind, col_ind = linear_sum_assignment(matching_pairs_matrix)
             score = len(row_ind) - matching_pairs_matrix[row_ind, col_ind].sum()
-            used_matches = [(paired_peaks1[x], paired_peaks2[y]) for (x, y) in zip(row_ind, col_ind)]
-            return score, used_matches
+            return score, len(row_ind)
+
+        def solve_sparse_assignment():
+            """Solve the assignment problem on the sparse graph of actual matches.
+
+            The dense cost matrix is typically only a few percent filled; the
+            sparse solver works on the matching pairs alone. Every row gets a
+            private dummy column of weight 1 (an intensity product of 0), which
+            plays the role of the ones-cells in the dense matrix: a row may
+            stay effectively unmatched. All weights are shifted by +1 so no
+            explicit zeros are dropped from the sparse matrix.
+            """
+            rows, cols = inverse1, inverse2
+            n_rows = rows.max() + 1
+            n_cols = cols.max() + 1
+            if n_rows > n_cols:
+                rows, cols = cols, rows
+                n_rows, n_cols = n_cols, n_rows
+            data = np.concatenate((1.0 + products, np.ones(n_rows)))
+            graph_rows = np.concatenate((rows, np.arange(n_rows)))
+            graph_cols = np.concatenate((cols, n_cols + np.arange(n_rows)))
+            graph = csr_matrix((data, (graph_rows, graph_cols)),
+                               shape=(n_rows, n_cols + n_rows))
+            row_ind, col_ind = min_weight_full_bipartite_matching(graph, maximize=True)
+            score = np.asarray(graph[row_ind, col_ind]).sum() - n_rows
+            return score, len(row_ind)
 
         def calc_score():
             """Calculate cosine similarity score."""
-            if matching_pairs_matrix is None:
+            if matching_pairs is None:
                 return np.asarray((0.0, 0), dtype=self.score_datatype)
-            score, used_matches = solve_hungarian()
+            if min(inverse1.max(), inverse2.max()) + 1 <= 8:
+                # For very small problems the dense Hungarian solver wins.
+                score, n_matches = solve_hungarian()
+            else:
+                score, n_matches = solve_sparse_assignment()
             # Normalize score:
-            spec1_power = np.power(spec1[:, 0], self.mz_power) \
-                * np.power(spec1[:, 1], self.intensity_power)
-            spec2_power = np.power(spec2[:, 0], self.mz_power) \
-                * np.power(spec2[:, 1], self.intensity_power)
-            score = score/(np.sqrt(np.sum(spec1_power**2)) * np.sqrt(np.sum(spec2_power**2)))
-            return np.asarray((score, len(used_matches)), dtype=self.score_datatype)
-
-        spec1 = reference.peaks.to_numpy
-        spec2 = query.peaks.to_numpy
+            score = score/(self._get_power_norm(reference, mz1, intensities1)
+                           * self._get_power_norm(query, mz2, intensities2))
+            return np.asarray((score, n_matches), dtype=self.score_datatype)
+
+        peaks1 = reference.peaks
+        peaks2 = query.peaks
+        mz1, intensities1 = peaks1.mz, peaks1.intensities
+        mz2, intensities2 = peaks2.mz, peaks2.intensities
+        # The m/z arrays are sorted, so two comparisons suffice to detect
+        # non-overlapping spectra before any pair collection is attempted.
+        if mz1.shape[0] == 0 or mz2.shape[0] == 0 \
+                or mz1[-1] + self.tolerance < mz2[0] \
+                or mz2[-1] + self.tolerance < mz1[0]:
+            return np.asarray((0.0, 0), dtype=self.score_datatype)
         matching_pairs = get_matching_pairs()
-        paired_peaks1, paired_peaks2, matching_pairs_matrix = get_matching_pairs_matrix()
+        if matching_pairs is not None:
+            _, inverse1 = np.unique(matching_pairs[:, 0].astype(np.int64), return_inverse=True)
+            _, inverse2 = np.unique(matching_pairs[:, 1].astype(np.int64), return_inverse=True)
+            products = matching_pairs[:, 2]
         return calc_score()
@@ -109,14 +109,16 @@ class ModifiedCosine(BaseSimilarity):
 
         def get_matching_pairs():
             """Find all pairs of peaks that match within the given tolerance."""
-            zero_pairs = collect_peak_pairs(spec1, spec2, self.tolerance, shift=0.0,
+            zero_pairs = collect_peak_pairs(mz1, intensities1, mz2, intensities2,
+                                            self.tolerance, shift=0.0,
                                             mz_power=self.mz_power,
                                             intensity_power=self.intensity_power)
             precursor_mz_ref = get_valid_precursor_mz(reference)
             precursor_mz_query = get_valid_precursor_mz(query)
 
             mass_shift = precursor_mz_ref - precursor_mz_query
-            nonzero_pairs = collect_peak_pairs(spec1, spec2, self.tolerance, shift=mass_shift,
+            nonzero_pairs = collect_peak_pairs(mz1, intensities1, mz2, intensities2,
+                                               self.tolerance, shift=mass_shift,
                                                mz_power=self.mz_power,
                                                intensity_power=self.intensity_power)
 
@@ -126,14 +128,16 @@ class ModifiedCosine(BaseSimilarity):
                 nonzero_pairs = np.zeros((0, 3))
             matching_pairs = np.concatenate((zero_pairs, nonzero_pairs), axis=0)
             if matching_pairs.shape[0] > 0:
-                matching_pairs = matching_pairs[np.argsort(matching_pairs[:, 2])[::-1], :]
+                matching_pairs = matching_pairs[np.argsort(-matching_pairs[:, 2], kind="stable"), :]
             return matching_pairs
 
-        spec1 = reference.peaks.to_numpy
-        spec2 = query.peaks.to_numpy
+        peaks1 = reference.peaks
+        peaks2 = query.peaks
+        mz1, intensities1 = peaks1.mz, peaks1.intensities
+        mz2, intensities2 = peaks2.mz, peaks2.intensities
         matching_pairs = get_matching_pairs()
         if matching_pairs.shape[0] == 0:
             return np.asarray((float(0), 0), dtype=self.score_datatype)
-        score = score_best_matches(matching_pairs, spec1, spec2,
+        score = score_best_matches(matching_pairs, mz1, intensities1, mz2, intensities2,
                                    self.mz_power, self.intensity_power)
         return np.asarray(score, dtype=self.score_datatype)
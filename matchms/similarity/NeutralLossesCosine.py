@@ -85,27 +85,32 @@ class NeutralLossesCosine(BaseSimilarity):
 
         def get_matching_pairs():
             """Find all pairs of peaks that match within the given tolerance."""
-            matching_pairs = collect_peak_pairs(spec1, spec2, self.tolerance, shift=mass_shift,
+            matching_pairs = collect_peak_pairs(mz1, intensities1, mz2, intensities2,
+                                                self.tolerance, shift=mass_shift,
                                                 mz_power=self.mz_power,
                                                 intensity_power=self.intensity_power)
             if matching_pairs is None:
                 return None
             if matching_pairs.shape[0] > 0:
-                matching_pairs = matching_pairs[np.argsort(matching_pairs[:, 2])[::-1], :]
+                matching_pairs = matching_pairs[np.argsort(-matching_pairs[:, 2], kind="stable"), :]
             return matching_pairs
 
         precursor_mz_ref = get_valid_precursor_mz(reference)
         precursor_mz_query = get_valid_precursor_mz(query)
         mass_shift = precursor_mz_ref - precursor_mz_query
 
-        spec1 = reference.peaks.to_numpy
-        spec2 = query.peaks.to_numpy
+        peaks1 = reference.peaks
+        peaks2 = query.peaks
+        mz1, intensities1 = peaks1.mz, peaks1.intensities
+        mz2, intensities2 = peaks2.mz, peaks2.intensities
         if self.ignore_peaks_above_precursor:
-            spec1 = spec1[np.where(spec1[:, 0] < precursor_mz_ref)]
-            spec2 = spec2[np.where(spec2[:, 0] < precursor_mz_query)]
+            mask1 = mz1 < precursor_mz_ref
+            mask2 = mz2 < precursor_mz_query
+            mz1, intensities1 = mz1[mask1], intensities1[mask1]
+            mz2, intensities2 = mz2[mask2], intensities2[mask2]
         matching_pairs = get_matching_pairs()
         if matching_pairs is None:
             return np.asarray((float(0), 0), dtype=self.score_datatype)
-        score = score_best_matches(matching_pairs, spec1, spec2,
+        score = score_best_matches(matching_pairs, mz1, intensities1, mz2, intensities2,
                                    self.mz_power, self.intensity_power)
         return np.asarray(score, dtype=self.score_datatype)
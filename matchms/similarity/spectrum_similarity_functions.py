@@ -1,10 +1,11 @@
-from typing import List, Tuple
+from typing import Tuple
 import numba
 import numpy as np
 
 
-@numba.njit
-def collect_peak_pairs(spec1: np.ndarray, spec2: np.ndarray,
+@numba.njit(cache=True, nogil=True)
+def collect_peak_pairs(spec1_mz: np.ndarray, spec1_intensities: np.ndarray,
+                       spec2_mz: np.ndarray, spec2_intensities: np.ndarray,
                        tolerance: float, shift: float = 0, mz_power: float = 0.0,
                        intensity_power: float = 1.0):
     # pylint: disable=too-many-arguments
@@ -12,10 +13,14 @@ def collect_peak_pairs(spec1: np.ndarray, spec2: np.ndarray,
 
     Args
     ----
-    spec1:
-        Spectrum peaks and intensities as numpy array.
-    spec2:
-        Spectrum peaks and intensities as numpy array.
+    spec1_mz:
+        Spectrum peak m/z values as numpy array. Peak mz values must be ordered.
+    spec1_intensities:
+        Spectrum peak intensities as numpy array.
+    spec2_mz:
+        Spectrum peak m/z values as numpy array. Peak mz values must be ordered.
+    spec2_intensities:
+        Spectrum peak intensities as numpy array.
     tolerance
         Peaks will be considered a match when <= tolerance appart.
     shift
@@ -31,25 +36,84 @@ def collect_peak_pairs(spec1: np.ndarray, spec2: np.ndarray,
     matching_pairs : numpy array
         Array of found matching peaks.
     """
-    matches = find_matches(spec1[:, 0], spec2[:, 0], tolerance, shift)
-    idx1 = [x[0] for x in matches]
-    idx2 = [x[1] for x in matches]
-    if len(idx1) == 0:
+    # Match in int32 micro-Dalton where the m/z range permits: 1e-6 Da is
+    # well below any realistic mass accuracy, int32 lanes halve the memory
+    # traffic of the search, and integer compares are cheaper than float ones.
+    # Peaks beyond ~2000 Da (int32 overflow) as well as sub-micro-Dalton
+    # tolerances or shifts (which would round to zero and over-match peaks
+    # quantized to the same micro-Dalton) fall back to the float64 kernel.
+    if spec1_mz.shape[0] > 0 and spec2_mz.shape[0] > 0 and \
+            tolerance >= 1e-6 and (shift == 0 or abs(shift) >= 1e-6) and \
+            (max(spec1_mz[-1], spec2_mz[-1]) + abs(shift) + tolerance) * 1e6 < 2147483647.0:
+        spec1_mz_uda = np.empty(spec1_mz.shape[0], dtype=np.int32)
+        for i in range(spec1_mz.shape[0]):
+            spec1_mz_uda[i] = np.int32(round(spec1_mz[i] * 1e6))
+        spec2_mz_uda = np.empty(spec2_mz.shape[0], dtype=np.int32)
+        for i in range(spec2_mz.shape[0]):
+            spec2_mz_uda[i] = np.int32(round(spec2_mz[i] * 1e6))
+        idx1, idx2 = find_matches_udalton(spec1_mz_uda, spec2_mz_uda,
+                                          np.int64(round(tolerance * 1e6)),
+                                          np.int64(round(shift * 1e6)))
+    else:
+        idx1, idx2 = find_matches(spec1_mz, spec2_mz, tolerance, shift)
+    if idx1.shape[0] == 0:
         return None
-    matching_pairs = []
-    for i, idx in enumerate(idx1):
-        power_prod_spec1 = (spec1[idx, 0] ** mz_power) * (spec1[idx, 1] ** intensity_power)
-        power_prod_spec2 = (spec2[idx2[i], 0] ** mz_power) * (spec2[idx2[i], 1] ** intensity_power)
-        matching_pairs.append([idx, idx2[i], power_prod_spec1 * power_prod_spec2])
-    return np.array(matching_pairs.copy())
+    matching_pairs = np.empty((idx1.shape[0], 3))
+    for i in range(idx1.shape[0]):
+        power_prod_spec1 = (spec1_mz[idx1[i]] ** mz_power) * (spec1_intensities[idx1[i]] ** intensity_power)
+        power_prod_spec2 = (spec2_mz[idx2[i]] ** mz_power) * (spec2_intensities[idx2[i]] ** intensity_power)
+        matching_pairs[i, 0] = idx1[i]
+        matching_pairs[i, 1] = idx2[i]
+        matching_pairs[i, 2] = power_prod_spec1 * power_prod_spec2
+    return matching_pairs
 
 
-@numba.njit
+def collect_peak_pairs_numpy(spec1_mz: np.ndarray, spec1_intensities: np.ndarray,
+                             spec2_mz: np.ndarray, spec2_intensities: np.ndarray,
+                             tolerance: float, shift: float = 0, mz_power: float = 0.0,
+                             intensity_power: float = 1.0):
+    # pylint: disable=too-many-arguments
+    """Find matching pairs between two spectra without numba.
+
+    Vectorized twin of :func:`collect_peak_pairs`. The search window into
+    spec2 is found for all spec1 peaks at once with two binary searches over
+    the sorted m/z arrays, and the windows are expanded into index pairs with
+    numpy.repeat. This avoids JIT compilation entirely, which makes it the
+    better choice for similarity measures whose remaining work is plain
+    numpy/scipy anyway.
+
+    Takes the same arguments and returns the same (n_pairs, 3) array (or
+    None) as :func:`collect_peak_pairs`.
+    """
+    targets = spec1_mz - shift
+    lows = np.searchsorted(spec2_mz, targets - tolerance, side="left")
+    highs = np.searchsorted(spec2_mz, targets + tolerance, side="right")
+    counts = highs - lows
+    n_pairs = counts.sum()
+    if n_pairs == 0:
+        return None
+    idx1 = np.repeat(np.arange(spec1_mz.shape[0]), counts)
+    starts = np.cumsum(counts) - counts
+    idx2 = np.arange(n_pairs) - np.repeat(starts - lows, counts)
+    matching_pairs = np.empty((n_pairs, 3))
+    matching_pairs[:, 0] = idx1
+    matching_pairs[:, 1] = idx2
+    matching_pairs[:, 2] = (spec1_mz[idx1] ** mz_power * spec1_intensities[idx1] ** intensity_power) \
+        * (spec2_mz[idx2] ** mz_power * spec2_intensities[idx2] ** intensity_power)
+    return matching_pairs
+
+
+@numba.njit("UniTuple(i8[:], 2)(f8[:], f8[:], f8, f8)",
+            parallel=True, cache=True, fastmath=True, nogil=True, boundscheck=False)
 def find_matches(spec1_mz: np.ndarray, spec2_mz: np.ndarray,
-                 tolerance: float, shift: float = 0) -> List[Tuple[int, int]]:
+                 tolerance: float, shift: float = 0) -> Tuple[np.ndarray, np.ndarray]:
     """Faster search for matching peaks.
     Makes use of the fact that spec1 and spec2 contain ordered peak m/z (from
-    low to high m/z).
+    low to high m/z). The matching window into spec2 is found per spec1 peak
+    by binary search; since the rows are independent both passes run under
+    numba.prange. A first pass records each row's window, a second pass
+    scatters the index pairs to precomputed offsets, so no locks or
+    thread-local buffers are needed.
 
     Parameters
     ----------
@@ -65,32 +129,77 @@ def find_matches(spec1_mz: np.ndarray, spec2_mz: np.ndarray,
     Returns
     -------
     matches
-        List containing entries of type (idx1, idx2).
+        Tuple of two numpy arrays (idx1, idx2) with the indexes of matching peaks.
+
+    """
+    n_peaks1 = spec1_mz.shape[0]
+    lows = np.empty(n_peaks1, dtype=np.int64)
+    highs = np.empty(n_peaks1, dtype=np.int64)
+    for peak1_idx in numba.prange(n_peaks1):
+        target = spec1_mz[peak1_idx] - shift
+        lows[peak1_idx] = np.searchsorted(spec2_mz, target - tolerance, side="left")
+        highs[peak1_idx] = np.searchsorted(spec2_mz, target + tolerance, side="right")
+    counts = highs - lows
+    offsets = np.empty(n_peaks1 + 1, dtype=np.int64)
+    offsets[0] = 0
+    offsets[1:] = np.cumsum(counts)
+    n_matches = offsets[n_peaks1]
+    idx1 = np.empty(n_matches, dtype=np.int64)
+    idx2 = np.empty(n_matches, dtype=np.int64)
+    for peak1_idx in numba.prange(n_peaks1):
+        start = offsets[peak1_idx]
+        low = lows[peak1_idx]
+        for k in range(counts[peak1_idx]):
+            idx1[start + k] = peak1_idx
+            idx2[start + k] = low + k
+    return idx1, idx2
 
+
+@numba.njit("UniTuple(i8[:], 2)(i4[:], i4[:], i8, i8)",
+            parallel=True, cache=True, nogil=True, boundscheck=False)
+def find_matches_udalton(spec1_mz: np.ndarray, spec2_mz: np.ndarray,
+                         tolerance: int, shift: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """Integer twin of :func:`find_matches` operating on int32 micro-Dalton.
+
+    Same two-pass prange scheme as :func:`find_matches`; quantized m/z
+    values are produced in :func:`collect_peak_pairs`, which also guards
+    against int32 overflow. Tolerance and shift are given in micro-Dalton.
     """
-    lowest_idx = 0
-    matches = []
-    for peak1_idx in range(spec1_mz.shape[0]):
-        mz = spec1_mz[peak1_idx]
-        low_bound = mz - tolerance
-        high_bound = mz + tolerance
-        for peak2_idx in range(lowest_idx, spec2_mz.shape[0]):
-            mz2 = spec2_mz[peak2_idx] + shift
-            if mz2 > high_bound:
-                break
-            if mz2 < low_bound:
-                lowest_idx = peak2_idx
-            else:
-                matches.append((peak1_idx, peak2_idx))
-    return matches
+    n_peaks1 = spec1_mz.shape[0]
+    lows = np.empty(n_peaks1, dtype=np.int64)
+    highs = np.empty(n_peaks1, dtype=np.int64)
+    for peak1_idx in numba.prange(n_peaks1):
+        target = np.int64(spec1_mz[peak1_idx]) - shift
+        lows[peak1_idx] = np.searchsorted(spec2_mz, target - tolerance, side="left")
+        highs[peak1_idx] = np.searchsorted(spec2_mz, target + tolerance, side="right")
+    counts = highs - lows
+    offsets = np.empty(n_peaks1 + 1, dtype=np.int64)
+    offsets[0] = 0
+    offsets[1:] = np.cumsum(counts)
+    n_matches = offsets[n_peaks1]
+    idx1 = np.empty(n_matches, dtype=np.int64)
+    idx2 = np.empty(n_matches, dtype=np.int64)
+    for peak1_idx in numba.prange(n_peaks1):
+        start = offsets[peak1_idx]
+        low = lows[peak1_idx]
+        for k in range(counts[peak1_idx]):
+            idx1[start + k] = peak1_idx
+            idx2[start + k] = low + k
+    return idx1, idx2
 
 
 @numba.njit(fastmath=True)
-def score_best_matches(matching_pairs: np.ndarray, spec1: np.ndarray,
-                       spec2: np.ndarray, mz_power: float = 0.0,
+def score_best_matches(matching_pairs: np.ndarray, spec1_mz: np.ndarray,
+                       spec1_intensities: np.ndarray, spec2_mz: np.ndarray,
+                       spec2_intensities: np.ndarray, mz_power: float = 0.0,
                        intensity_power: float = 1.0) -> Tuple[float, int]:
     """Calculate cosine-like score by multiplying matches. Does require a sorted
-    list of matching peaks (sorted by intensity product)."""
+    list of matching peaks (sorted by intensity product).
+
+    The m/z and intensity arrays are expected to be the C-contiguous float64
+    arrays as stored on Spectrum.peaks; keeping them separate loads only the
+    needed column in the loops below.
+    """
     score = float(0.0)
     used_matches = int(0)
     used1 = set()
@@ -103,86 +212,120 @@ def score_best_matches(matching_pairs: np.ndarray, spec1: np.ndarray,
             used_matches += 1
 
     # Normalize score:
-    spec1_power = spec1[:, 0] ** mz_power * spec1[:, 1] ** intensity_power
-    spec2_power = spec2[:, 0] ** mz_power * spec2[:, 1] ** intensity_power
+    spec1_power = spec1_mz ** mz_power * spec1_intensities ** intensity_power
+    spec2_power = spec2_mz ** mz_power * spec2_intensities ** intensity_power
 
     score = score/(np.sum(spec1_power ** 2) ** 0.5 * np.sum(spec2_power ** 2) ** 0.5)
     return score, used_matches
 
 
-@numba.njit
+@numba.njit(cache=True)
 def number_matching(numbers_1, numbers_2, tolerance):
     """Find all pairs between numbers_1 and numbers_2 which are within tolerance.
     """
-    rows = []
-    cols = []
-    data = []
+    # Preallocated output buffers, grown by doubling (avoids numba
+    # reflected-list appends).
+    capacity = max(numbers_1.shape[0], 64)
+    rows = np.empty(capacity, dtype=np.int64)
+    cols = np.empty(capacity, dtype=np.int64)
+    n_found = 0
     for i, number_1 in enumerate(numbers_1):
         for j, number_2 in enumerate(numbers_2):
-            value = (abs(number_1 - number_2) <= tolerance)
-            if value:
-                data.append(value)
-                rows.append(i)
-                cols.append(j)
-    return np.array(rows), np.array(cols), np.array(data)
+            if abs(number_1 - number_2) <= tolerance:
+                if n_found == capacity:
+                    capacity *= 2
+                    new_rows = np.empty(capacity, dtype=np.int64)
+                    new_cols = np.empty(capacity, dtype=np.int64)
+                    new_rows[:n_found] = rows
+                    new_cols[:n_found] = cols
+                    rows = new_rows
+                    cols = new_cols
+                rows[n_found] = i
+                cols[n_found] = j
+                n_found += 1
+    return rows[:n_found], cols[:n_found], np.ones(n_found, dtype=np.bool_)
 
 
-@numba.njit
+@numba.njit(cache=True)
 def number_matching_symmetric(numbers_1, tolerance):
     """Find all pairs between numbers_1 and numbers_1 which are within tolerance.
     """
-    rows = []
-    cols = []
-    data = []
+    capacity = max(numbers_1.shape[0], 64)
+    rows = np.empty(capacity, dtype=np.int64)
+    cols = np.empty(capacity, dtype=np.int64)
+    n_found = 0
     for i, number_1 in enumerate(numbers_1):
         for j in range(i, len(numbers_1)):
-            value = (abs(number_1 - numbers_1[j]) <= tolerance)
-            if value:
-                data.append(value)
-                rows.append(i)
-                cols.append(j)
+            if abs(number_1 - numbers_1[j]) <= tolerance:
+                while n_found + 2 > capacity:
+                    capacity *= 2
+                    new_rows = np.empty(capacity, dtype=np.int64)
+                    new_cols = np.empty(capacity, dtype=np.int64)
+                    new_rows[:n_found] = rows[:n_found]
+                    new_cols[:n_found] = cols[:n_found]
+                    rows = new_rows
+                    cols = new_cols
+                rows[n_found] = i
+                cols[n_found] = j
+                n_found += 1
                 if i != j:
-                    data.append(value)
-                    rows.append(j)
-                    cols.append(i)
-    return np.array(rows), np.array(cols), np.array(data)
+                    rows[n_found] = j
+                    cols[n_found] = i
+                    n_found += 1
+    return rows[:n_found], cols[:n_found], np.ones(n_found, dtype=np.bool_)
 
 
-@numba.njit
+@numba.njit(cache=True)
 def number_matching_ppm(numbers_1, numbers_2, tolerance_ppm):
     """Find all pairs between numbers_1 and numbers_2 which are within tolerance.
     """
-    rows = []
-    cols = []
-    data = []
+    capacity = max(numbers_1.shape[0], 64)
+    rows = np.empty(capacity, dtype=np.int64)
+    cols = np.empty(capacity, dtype=np.int64)
+    n_found = 0
     for i, number_1 in enumerate(numbers_1):
         for j, number_2 in enumerate(numbers_2):
             mean_value = (number_1 + number_2)/2
-            value = (abs(number_1 - number_2)/mean_value * 1e6 <= tolerance_ppm)
-            if value:
-                data.append(value)
-                rows.append(i)
-                cols.append(j)
-    return np.array(rows), np.array(cols), np.array(data)
+            if abs(number_1 - number_2)/mean_value * 1e6 <= tolerance_ppm:
+                if n_found == capacity:
+                    capacity *= 2
+                    new_rows = np.empty(capacity, dtype=np.int64)
+                    new_cols = np.empty(capacity, dtype=np.int64)
+                    new_rows[:n_found] = rows
+                    new_cols[:n_found] = cols
+                    rows = new_rows
+                    cols = new_cols
+                rows[n_found] = i
+                cols[n_found] = j
+                n_found += 1
+    return rows[:n_found], cols[:n_found], np.ones(n_found, dtype=np.bool_)
 
 
-@numba.njit
+@numba.njit(cache=True)
 def number_matching_symmetric_ppm(numbers_1, tolerance_ppm):
     """Find all pairs between numbers_1 and numbers_1 which are within tolerance.
     """
-    rows = []
-    cols = []
-    data = []
+    capacity = max(numbers_1.shape[0], 64)
+    rows = np.empty(capacity, dtype=np.int64)
+    cols = np.empty(capacity, dtype=np.int64)
+    n_found = 0
     for i, number_1 in enumerate(numbers_1):
         for j in range(i, len(numbers_1)):
             mean_value = (number_1 + numbers_1[j])/2
-            value = (abs(number_1 - numbers_1[j])/mean_value * 1e6 <= tolerance_ppm)
-            if value:
-                data.append(value)
-                rows.append(i)
-                cols.append(j)
+            if abs(number_1 - numbers_1[j])/mean_value * 1e6 <= tolerance_ppm:
+                while n_found + 2 > capacity:
+                    capacity *= 2
+                    new_rows = np.empty(capacity, dtype=np.int64)
+                    new_cols = np.empty(capacity, dtype=np.int64)
+                    new_rows[:n_found] = rows[:n_found]
+                    new_cols[:n_found] = cols[:n_found]
+                    rows = new_rows
+                    cols = new_cols
+                rows[n_found] = i
+                cols[n_found] = j
+                n_found += 1
                 if i != j:
-                    data.append(value)
-                    rows.append(j)
-                    cols.append(i)
-    return np.array(rows), np.array(cols), np.array(data)
+                    rows[n_found] = j
+                    cols[n_found] = i
+                    n_found += 1
+    return rows[:n_found], cols[:n_found], np.ones(n_found, dtype=np.bool_)
@@ -6,3 +6,12 @@ def test_run_predefined_filter_sets():
     """Tests if all predefined filter sets can be run"""
     for filter_set in ALL_FILTER_SETS:
         SpectrumProcessor(filter_set)
+
+
+def test_no_duplicates_in_filter_sets():
+    """Tests that no filter appears twice within one predefined filter set"""
+    for filter_set in ALL_FILTER_SETS:
+        filter_names = [f[0].__name__ if isinstance(f, tuple) else f.__name__
+                        for f in filter_set]
+        assert len(filter_names) == len(set(filter_names)), \
+            "One of the filters appears twice in a predefined filter set"
@@ -1,4 +1,6 @@
 import os
+import pickle
+from functools import partial
 import numpy as np
 import pytest
 from matchms import SpectrumProcessor
@@ -88,6 +90,34 @@ def test_no_filters():
     assert spectrum_out == spectrum_in
 
 
+def test_parameterized_filters_stored_as_partial():
+    """Test that parameterized filters are stored as picklable functools.partial objects"""
+    processor = SpectrumProcessor(filters=[("require_correct_ionmode", {"ion_mode_to_keep": "both"}),
+                                           "make_charge_int",
+                                           ])
+    stored = {f.__name__: f for f in processor.filters}
+    assert isinstance(stored["require_correct_ionmode"], partial)
+    assert stored["require_correct_ionmode"].keywords == {"ion_mode_to_keep": "both"}
+    assert not isinstance(stored["make_charge_int"], partial)
+
+    unpickled = pickle.loads(pickle.dumps(processor))
+    assert unpickled.processing_steps == processor.processing_steps
+
+
+def test_process_spectrum_fused_chain_updates(spectrums):
+    """Test that the fused filter chain is rebuilt after adding a filter."""
+    processor = SpectrumProcessor(filters=["make_charge_int",
+                                           "interpret_pepmass",
+                                           ])
+    spectrum_out = processor.process_spectrum(spectrums[0])
+    assert spectrum_out.get("precursor_mz") == 100
+    assert spectrum_out.peaks.intensities.max() == 10
+
+    processor.parse_and_add_filter("normalize_intensities")
+    spectrum_out = processor.process_spectrum(spectrums[0])
+    assert spectrum_out.peaks.intensities.max() == 1.0
+
+
 def test_filter_spectrums(spectrums):
     processor = SpectrumProcessor(filters=["make_charge_int",
                                            "interpret_pepmass",
@@ -102,6 +132,22 @@ def test_filter_spectrums(spectrums):
     assert actual_masses == expected_masses
 
 
+def test_filter_spectrums_parallel(spectrums):
+    processor = SpectrumProcessor(filters=["make_charge_int",
+                                           "interpret_pepmass",
+                                           "derive_ionmode",
+                                           "correct_charge",
+                                           ])
+    processed, report = processor.process_spectrums(spectrums, n_jobs=2, progress_bar=False)
+
+    assert len(processed) == 3
+    actual_masses = [s.get("precursor_mz") for s in processed]
+    assert actual_masses == [100, 102, 104]
+    assert report.counter_number_processed == 3
+    assert dict(report.counter_changed_metadata) == \
+        {"make_charge_int": 2, "interpret_pepmass": 3, "derive_ionmode": 3}
+
+
 def test_filter_spectrums_report(spectrums):
     processor = SpectrumProcessor(filters=["make_charge_int",
                                            "interpret_pepmass",
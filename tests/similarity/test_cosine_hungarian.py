@@ -137,6 +137,22 @@ def test_cosine_hungarian_case_without_matches():
     assert score["matches"] == 0, "Expected different number of matching peaks."
 
 
+def test_cosine_hungarian_case_without_mz_overlap():
+    """Test case for spectrums whose m/z ranges do not overlap at all."""
+    spectrum_1 = Spectrum(mz=np.array([100, 200], dtype="float"),
+                          intensities=np.array([1.0, 0.1], dtype="float"),
+                          metadata={})
+
+    spectrum_2 = Spectrum(mz=np.array([300, 400], dtype="float"),
+                          intensities=np.array([1.0, 0.1], dtype="float"),
+                          metadata={})
+
+    cosine_hungarian = CosineHungarian()
+    score = cosine_hungarian.pair(spectrum_1, spectrum_2)
+    assert score["score"] == 0.0, "Expected different cosine score."
+    assert score["matches"] == 0, "Expected different number of matching peaks."
+
+
 def test_cosine_hungarian_with_peak_powers():
     """Compare output cosine score with own calculation on simple dummy spectrums.
     Here testing the options to raise peak intensities to given powers.
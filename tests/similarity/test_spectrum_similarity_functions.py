@@ -3,9 +3,9 @@ pure Python version."""
 import numpy as np
 import pytest
 from matchms.similarity.spectrum_similarity_functions import (
-    collect_peak_pairs, find_matches, number_matching, number_matching_ppm,
-    number_matching_symmetric, number_matching_symmetric_ppm,
-    score_best_matches)
+    collect_peak_pairs, collect_peak_pairs_numpy, find_matches,
+    number_matching, number_matching_ppm, number_matching_symmetric,
+    number_matching_symmetric_ppm, score_best_matches)
 from ..builder_Spectrum import SpectrumBuilder
 
 
@@ -34,7 +34,8 @@ def test_collect_peak_pairs(numba_compiled, shift, expected_pairs, expected_matc
     spec1, spec2 = spectra
 
     func = get_function(numba_compiled, collect_peak_pairs)
-    matching_pairs = func(spec1, spec2, tolerance=0.2, shift=shift)
+    matching_pairs = func(spec1[:, 0], spec1[:, 1], spec2[:, 0], spec2[:, 1],
+                          tolerance=0.2, shift=shift)
 
     if expected_matches is not None:
         matching_pairs = np.array(matching_pairs)
@@ -44,6 +45,25 @@ def test_collect_peak_pairs(numba_compiled, shift, expected_pairs, expected_matc
         assert matching_pairs is None, "Expected pairs to be None."
 
 
+@pytest.mark.parametrize("shift, expected_pairs, expected_matches", [
+    (0.0, [[2., 2., 1.], [3., 3., 1.]], (2, 3)),
+    (-5.0, [[0., 0., 0.01], [1., 1., 0.01]], (2, 3)),
+    (-20.0, None, None)
+])
+def test_collect_peak_pairs_numpy(shift, expected_pairs, expected_matches, spectra):
+    """Test finding expected peak matches with the pure numpy implementation."""
+    spec1, spec2 = spectra
+
+    matching_pairs = collect_peak_pairs_numpy(spec1[:, 0], spec1[:, 1], spec2[:, 0], spec2[:, 1],
+                                              tolerance=0.2, shift=shift)
+
+    if expected_matches is not None:
+        assert matching_pairs.shape == expected_matches, "Expected different number of matching peaks"
+        assert np.allclose(matching_pairs, np.array(expected_pairs), atol=1e-8), "Expected different values."
+    else:
+        assert matching_pairs is None, "Expected pairs to be None."
+
+
 @pytest.mark.parametrize("numba_compiled", [True, False])
 @pytest.mark.parametrize("shift, expected_matches", [
     (-5.0, [(0, 0), (1, 1), (2, 3)]),
@@ -55,9 +75,9 @@ def test_find_matches(numba_compiled, shift, expected_matches):
     spec2_mz = np.array([105, 205.1, 300, 304.99, 500.1], dtype="float")
 
     func = get_function(numba_compiled, find_matches)
-    matches = func(spec1_mz, spec2_mz, tolerance=0.2, shift=shift)
+    idx1, idx2 = func(spec1_mz, spec2_mz, tolerance=0.2, shift=shift)
 
-    assert expected_matches == matches, "Expected different matches."
+    assert list(zip(idx1, idx2)) == expected_matches, "Expected different matches."
 
 
 @pytest.mark.parametrize("numba_compiled", [True, False])
@@ -71,7 +91,7 @@ def test_score_best_matches(numba_compiled, matching_pairs, expected_score, spec
 
     func = get_function(numba_compiled, score_best_matches)
 
-    score, matches = func(matching_pairs, spec1, spec2)
+    score, matches = func(matching_pairs, spec1[:, 0], spec1[:, 1], spec2[:, 0], spec2[:, 1])
     assert score == pytest.approx(expected_score[0], 1e-6), "Expected different score"
     assert matches == expected_score[1], "Expected different matches."
 